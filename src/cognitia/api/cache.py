@@ -7,9 +7,10 @@ Provides fast access to:
 - Active client connections
 """
 
+import fnmatch
 import json
 import os
-from datetime import timedelta
+import time
 from typing import Any, Optional
 
 try:
@@ -20,6 +21,8 @@ except ImportError:
 
 from loguru import logger
 
+from .orchestrator import _json_dumpb, _json_loads
+
 # Redis configuration
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
 CACHE_TTL_SESSION = int(os.getenv("CACHE_TTL_SESSION", "3600"))  # 1 hour
@@ -71,12 +74,11 @@ class CacheManager:
     async def set(self, key: str, value: Any, ttl: int = 3600) -> bool:
         """Set a cache value with TTL."""
         try:
-            serialized = json.dumps(value) if not isinstance(value, str) else value
+            serialized = _json_dumpb(value) if not isinstance(value, str) else value
             
             if self._connected and self.redis:
                 await self.redis.setex(key, ttl, serialized)
             else:
-                import time
                 self._memory_cache[key] = (serialized, time.time() + ttl)
             return True
         except Exception as e:
@@ -89,7 +91,6 @@ class CacheManager:
             if self._connected and self.redis:
                 value = await self.redis.get(key)
             else:
-                import time
                 cached = self._memory_cache.get(key)
                 if cached and cached[1] > time.time():
                     value = cached[0]
@@ -100,7 +101,7 @@ class CacheManager:
             
             if value:
                 try:
-                    return json.loads(value)
+                    return _json_loads(value)
                 except json.JSONDecodeError:
                     return value
             return None
@@ -128,7 +129,6 @@ class CacheManager:
                 if keys:
                     return await self.redis.delete(*keys)
             else:
-                import fnmatch
                 deleted = 0
                 to_delete = [k for k in self._memory_cache if fnmatch.fnmatch(k, pattern)]
                 for k in to_delete:
@@ -195,9 +195,9 @@ class CacheManager:
         """Append a message to the cached messages list."""
         messages = await self.get_recent_messages(chat_id) or []
         messages.append(message)
-        # Keep only last 50 messages in cache
+        # Keep only last 50 messages in cache (trim in place, no slice copy)
         if len(messages) > 50:
-            messages = messages[-50:]
+            del messages[:-50]
         await self.set_recent_messages(chat_id, messages)
     
     # Character preprompt caching
@@ -225,7 +225,6 @@ class CacheManager:
             if not isinstance(connections, set):
                 connections = set()
             connections.add(connection_id)
-            import time
             self._memory_cache[key] = (connections, time.time() + CACHE_TTL_SESSION)
     
     async def unregister_ws(self, user_id: str, connection_id: str):
@@ -9,69 +9,70 @@ import json
 import os
 from collections.abc import AsyncIterator
 
-import httpx
+from .orchestrator import _json_loads, get_http_client
 
 
-async def stream_ollama_response(messages: list[dict], system_prompt: str) -> AsyncIterator[str]:
-    """Stream response from Ollama (text-only fallback)."""
-    ollama_url = os.getenv("OLLAMA_URL", "http://10.0.0.15:11434").rstrip("/")
-    ollama_model = os.getenv("OLLAMA_MODEL", "hf.co/TheBloke/Mythalion-13B-GGUF:Q4_K_M")
+def _get_int(name: str, default: int) -> int:
+    raw = os.getenv(name)
+    if raw is None or raw == "":
+        return default
+    try:
+        return int(raw)
+    except Exception:
+        return default
 
-    def _get_int(name: str, default: int) -> int:
-        raw = os.getenv(name)
-        if raw is None or raw == "":
-            return default
-        try:
-            return int(raw)
-        except Exception:
-            return default
 
-    def _get_float(name: str, default: float) -> float:
-        raw = os.getenv(name)
-        if raw is None or raw == "":
-            return default
-        try:
-            return float(raw)
-        except Exception:
-            return default
+def _get_float(name: str, default: float) -> float:
+    raw = os.getenv(name)
+    if raw is None or raw == "":
+        return default
+    try:
+        return float(raw)
+    except Exception:
+        return default
 
-    options: dict = {
-        "temperature": _get_float("OLLAMA_TEMPERATURE", 0.7),
-        "top_p": _get_float("OLLAMA_TOP_P", 0.9),
-        "top_k": _get_int("OLLAMA_TOP_K", 40),
-        "repeat_penalty": _get_float("OLLAMA_REPEAT_PENALTY", 1.15),
-        "repeat_last_n": _get_int("OLLAMA_REPEAT_LAST_N", 128),
-    }
-    num_ctx_raw = os.getenv("OLLAMA_NUM_CTX")
-    if num_ctx_raw:
-        try:
-            options["num_ctx"] = int(num_ctx_raw)
-        except Exception:
-            pass
 
+OLLAMA_URL = os.getenv("OLLAMA_URL", "http://10.0.0.15:11434").rstrip("/")
+OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "hf.co/TheBloke/Mythalion-13B-GGUF:Q4_K_M")
+OLLAMA_CHAT_URL = f"{OLLAMA_URL}/api/chat"
+
+OLLAMA_OPTIONS: dict = {
+    "temperature": _get_float("OLLAMA_TEMPERATURE", 0.7),
+    "top_p": _get_float("OLLAMA_TOP_P", 0.9),
+    "top_k": _get_int("OLLAMA_TOP_K", 40),
+    "repeat_penalty": _get_float("OLLAMA_REPEAT_PENALTY", 1.15),
+    "repeat_last_n": _get_int("OLLAMA_REPEAT_LAST_N", 128),
+}
+_num_ctx = _get_int("OLLAMA_NUM_CTX", 0)
+if _num_ctx:
+    OLLAMA_OPTIONS["num_ctx"] = _num_ctx
+
+
+async def stream_ollama_response(messages: list[dict], system_prompt: str) -> AsyncIterator[str]:
+    """Stream response from Ollama (text-only fallback)."""
     full_messages = [{"role": "system", "content": system_prompt}] + messages
     payload = {
-        "model": ollama_model,
+        "model": OLLAMA_MODEL,
         "messages": full_messages,
         "stream": True,
-        "options": options,
+        "options": OLLAMA_OPTIONS,
     }
 
-    async with httpx.AsyncClient(timeout=120.0) as client:
-        async with client.stream(
-            "POST",
-            f"{ollama_url}/api/chat",
-            json=payload,
-        ) as response:
-            async for line in response.aiter_lines():
-                if not line:
-                    continue
-                try:
-                    data = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-                content = data.get("message", {}).get("content", "")
-                if content:
-                    yield content
-                if data.get("done"):
-                    break
+    async with get_http_client().stream(
+        "POST",
+        OLLAMA_CHAT_URL,
+        json=payload,
+        timeout=120.0,
+    ) as response:
+        async for line in response.aiter_lines():
+            if not line:
+                continue
+            try:
+                data = _json_loads(line)
+            except json.JSONDecodeError:
+                continue
+            content = data.get("message", {}).get("content", "")
+            if content:
+                yield content
+            if data.get("done"):
+                break
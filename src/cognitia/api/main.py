@@ -19,6 +19,7 @@ from loguru import logger
 from .cache import init_cache, close_cache
 from .database import init_db
 from .memory_client import memory_client
+from .orchestrator import close_http_client
 from .routes_auth import router as auth_router
 from .routes_characters import router as characters_router
 from .routes_chats import router as chats_router
@@ -40,6 +41,8 @@ async def lifespan(app: FastAPI):
     logger.info("Cognitia API started")
     yield
     await publisher.close()
+    await memory_client.close()
+    await close_http_client()
     await close_cache()
     logger.info("Cognitia API shutting down")
 
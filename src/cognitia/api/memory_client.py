@@ -23,6 +23,19 @@ class MemoryClient:
         """
         self.base_url = base_url.rstrip("/")
         self._available = None  # Cache availability check
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the pooled client, creating it on first use."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(base_url=self.base_url)
+        return self._client
+
+    async def close(self) -> None:
+        """Close the pooled client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def check_health(self) -> bool:
         """Check if memory service is available.
@@ -31,14 +44,13 @@ class MemoryClient:
             True if service is healthy or degraded, False otherwise
         """
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(f"{self.base_url}/health")
-                if response.status_code == 200:
-                    data = response.json()
-                    status = data.get("status", "")
-                    self._available = status in ("healthy", "degraded")
-                    return self._available
-                return False
+            response = await self._get_client().get("/health", timeout=5.0)
+            if response.status_code == 200:
+                data = response.json()
+                status = data.get("status", "")
+                self._available = status in ("healthy", "degraded")
+                return self._available
+            return False
         except Exception as e:
             logger.debug(f"Memory service health check failed: {e}")
             self._available = False
@@ -77,13 +89,13 @@ class MemoryClient:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.post(
-                    f"{self.base_url}/ingest",
-                    json=payload,
-                )
-                response.raise_for_status()
-                return response.json()
+            response = await self._get_client().post(
+                "/ingest",
+                json=payload,
+                timeout=10.0,
+            )
+            response.raise_for_status()
+            return response.json()
         except Exception as e:
             logger.error(f"Memory ingestion failed: {e}")
             return None
@@ -114,13 +126,13 @@ class MemoryClient:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.post(
-                    f"{self.base_url}/retrieve",
-                    json=payload,
-                )
-                response.raise_for_status()
-                return response.json()
+            response = await self._get_client().post(
+                "/retrieve",
+                json=payload,
+                timeout=10.0,
+            )
+            response.raise_for_status()
+            return response.json()
         except Exception as e:
             logger.error(f"Memory retrieval failed: {e}")
             return None
@@ -140,12 +152,12 @@ class MemoryClient:
             Memory service persona payload or None if failed
         """
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(
-                    f"{self.base_url}/persona/{user_id}/{character_id}",
-                )
-                response.raise_for_status()
-                return response.json()
+            response = await self._get_client().get(
+                f"/persona/{user_id}/{character_id}",
+                timeout=10.0,
+            )
+            response.raise_for_status()
+            return response.json()
         except Exception as e:
             logger.debug(f"Persona retrieval failed: {e}")
             return None
@@ -173,13 +185,13 @@ class MemoryClient:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:  # Longer timeout for LLM
-                response = await client.post(
-                    f"{self.base_url}/distill",
-                    json=payload,
-                )
-                response.raise_for_status()
-                return response.json()
+            response = await self._get_client().post(
+                "/distill",
+                json=payload,
+                timeout=60.0,  # Longer timeout for LLM
+            )
+            response.raise_for_status()
+            return response.json()
         except Exception as e:
             logger.error(f"Persona distillation failed: {e}")
             return None
@@ -199,12 +211,12 @@ class MemoryClient:
             True if successful, False otherwise
         """
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.delete(
-                    f"{self.base_url}/persona/{user_id}/{character_id}",
-                )
-                response.raise_for_status()
-                return True
+            response = await self._get_client().delete(
+                f"/persona/{user_id}/{character_id}",
+                timeout=10.0,
+            )
+            response.raise_for_status()
+            return True
         except Exception as e:
             logger.error(f"Persona deletion failed: {e}")
             return False
@@ -218,13 +230,13 @@ class MemoryClient:
     ) -> Optional[Dict[str, Any]]:
         """Retrieve a UI-friendly knowledge graph snapshot (nodes + edges)."""
         try:
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                response = await client.get(
-                    f"{self.base_url}/graph/{user_id}/{character_id}",
-                    params={"limit_nodes": limit_nodes, "limit_edges": limit_edges},
-                )
-                response.raise_for_status()
-                return response.json()
+            response = await self._get_client().get(
+                f"/graph/{user_id}/{character_id}",
+                params={"limit_nodes": limit_nodes, "limit_edges": limit_edges},
+                timeout=15.0,
+            )
+            response.raise_for_status()
+            return response.json()
         except Exception as e:
             logger.debug(f"Graph retrieval failed: {e}")
             return None
@@ -247,13 +259,13 @@ class MemoryClient:
             return None
 
         try:
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                response = await client.patch(
-                    f"{self.base_url}/graph/{user_id}/{character_id}/nodes/{node_id}",
-                    json=payload,
-                )
-                response.raise_for_status()
-                return response.json()
+            response = await self._get_client().patch(
+                f"/graph/{user_id}/{character_id}/nodes/{node_id}",
+                json=payload,
+                timeout=15.0,
+            )
+            response.raise_for_status()
+            return response.json()
         except Exception as e:
             logger.debug(f"Graph node update failed: {e}")
             return None
@@ -266,12 +278,12 @@ class MemoryClient:
     ) -> bool:
         """Delete a graph node (DETACH DELETE)."""
         try:
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                response = await client.delete(
-                    f"{self.base_url}/graph/{user_id}/{character_id}/nodes/{node_id}",
-                )
-                response.raise_for_status()
-                return True
+            response = await self._get_client().delete(
+                f"/graph/{user_id}/{character_id}/nodes/{node_id}",
+                timeout=15.0,
+            )
+            response.raise_for_status()
+            return True
         except Exception as e:
             logger.debug(f"Graph node delete failed: {e}")
             return False
@@ -284,12 +296,12 @@ class MemoryClient:
     ) -> bool:
         """Delete a graph edge."""
         try:
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                response = await client.delete(
-                    f"{self.base_url}/graph/{user_id}/{character_id}/edges/{edge_id}",
-                )
-                response.raise_for_status()
-                return True
+            response = await self._get_client().delete(
+                f"/graph/{user_id}/{character_id}/edges/{edge_id}",
+                timeout=15.0,
+            )
+            response.raise_for_status()
+            return True
         except Exception as e:
             logger.debug(f"Graph edge delete failed: {e}")
             return False
@@ -1,12 +1,42 @@
 """Orchestrator configuration helpers.
 
 The GPU orchestrator is the only GPU-host service reachable from the cluster.
-This module centralizes env var naming and defaults.
+This module centralizes env var naming and defaults, and owns the pooled
+HTTP client used for upstream (orchestrator / Ollama) calls.
+
+Env (shared upstream client):
+- HTTP_MAX_CONNECTIONS: pool size; each streamed reply holds one connection (default: 200)
+- HTTP_MAX_KEEPALIVE_CONNECTIONS: idle connections kept open (default: 20)
+- HTTP_POOL_TIMEOUT: seconds to wait for a free connection before failing (default: 10)
 """
 
 from __future__ import annotations
 
+import json
 import os
+from typing import Any, Optional
+
+import httpx
+
+try:
+    import orjson  # type: ignore[import-not-found]
+
+    # Shared by the API modules that (de)serialize upstream/cache JSON.
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers keep
+    # catching the stdlib exception either way.
+    _json_loads = orjson.loads
+    _json_dumpb = orjson.dumps  # UTF-8 bytes, non-ASCII unescaped
+except Exception:  # pragma: no cover
+    _json_loads = json.loads
+
+    def _json_dumpb(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "200"))
+HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "20"))
+HTTP_POOL_TIMEOUT = float(os.getenv("HTTP_POOL_TIMEOUT", "10"))
+
+_http_client: Optional[httpx.AsyncClient] = None
 
 
 def get_orchestrator_url() -> str:
@@ -16,3 +46,30 @@ def get_orchestrator_url() -> str:
         os.getenv("COGNITIA_CORE_URL", "http://10.0.0.15:8080"),
     )
     return url.rstrip("/")
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared upstream HTTP client (orchestrator / Ollama fallback).
+
+    Created lazily. Reads are unbounded by default so long token streams aren't cut
+    off, but waiting for a pooled connection is bounded; callers may pass tighter
+    per-request timeouts.
+    """
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(None, pool=HTTP_POOL_TIMEOUT),
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            ),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared upstream HTTP client, if it was created."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
@@ -1,13 +1,13 @@
 """Character router: CRUD operations for AI characters."""
 
 import os
-import shutil
 from pathlib import Path
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
 
 from .auth import get_user_id
 from .cache import cache
@@ -29,6 +29,58 @@ AVATAR_UPLOAD_DIR = Path(os.getenv("AVATAR_UPLOAD_DIR", "./web/avatars"))
 AVATAR_UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
 
 
+# Uploads are spooled by Starlette; copy them out in large bounded chunks.
+UPLOAD_CHUNK_SIZE = 1 << 20
+# Optional cap on a single uploaded file (bytes); 0 disables the limit.
+MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_BYTES", "0"))
+
+
+def _stage_upload(upload: UploadFile, target: Path) -> Path:
+    """Stream an upload into a sibling temp file in fixed-size chunks and return its path.
+
+    The real target is left untouched, so a rejected upload never clobbers existing data.
+    Blocking; run in a worker thread.
+    """
+    tmp = target.with_name(f"{target.name}.part")
+    written = 0
+    try:
+        with open(tmp, "wb") as f:
+            while chunk := upload.file.read(UPLOAD_CHUNK_SIZE):
+                written += len(chunk)
+                if MAX_UPLOAD_BYTES and written > MAX_UPLOAD_BYTES:
+                    raise HTTPException(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail="Uploaded file is too large",
+                    )
+                f.write(chunk)
+    except Exception:
+        tmp.unlink(missing_ok=True)
+        raise
+    return tmp
+
+
+def _save_upload(upload: UploadFile, target: Path) -> None:
+    """Stage an upload and move it over ``target`` only once it is complete (blocking)."""
+    os.replace(_stage_upload(upload, target), target)
+
+
+def _remove_files(*paths: str | None) -> None:
+    """Best-effort removal of previously stored files (blocking; run in a worker thread)."""
+    for raw in paths:
+        if not raw:
+            continue
+        path = Path(raw)
+        if path.exists():
+            path.unlink()
+
+
+def _replace_voice_files(staged: dict[Path, Path], old_paths: tuple[str | None, ...]) -> None:
+    """Swap staged voice files into place, then drop old files they don't overwrite (blocking)."""
+    for tmp, target in staged.items():
+        os.replace(tmp, target)
+    _remove_files(*(p for p in old_paths if p and Path(p) not in staged.values()))
+
+
 @router.get("/", response_model=CharacterListResponse)
 async def list_characters(
     user_id: UUID = Depends(get_user_id),
@@ -164,15 +216,7 @@ async def delete_character(
         )
     
     # Delete RVC model files if they exist
-    if character.rvc_model_path:
-        model_path = Path(character.rvc_model_path)
-        if model_path.exists():
-            model_path.unlink()
-    
-    if character.rvc_index_path:
-        index_path = Path(character.rvc_index_path)
-        if index_path.exists():
-            index_path.unlink()
+    await run_in_threadpool(_remove_files, character.rvc_model_path, character.rvc_index_path)
     
     await session.delete(character)
     await session.commit()
@@ -215,37 +259,34 @@ async def upload_voice_model(
     user_dir = RVC_UPLOAD_DIR / str(user_id)
     user_dir.mkdir(parents=True, exist_ok=True)
     
-    # Delete old files if they exist
-    if character.rvc_model_path:
-        old_model = Path(character.rvc_model_path)
-        if old_model.exists():
-            old_model.unlink()
-    
-    if character.rvc_index_path:
-        old_index = Path(character.rvc_index_path)
-        if old_index.exists():
-            old_index.unlink()
+    has_index = bool(index_file and index_file.filename)
+    if has_index and not index_file.filename.endswith(".index"):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Index file must be a .index file",
+        )
     
-    # Save model file
+    # Stage the new files next to their targets first; the old ones stay intact
+    # until every upload has been written in full.
     model_path = user_dir / f"{character_id}.pth"
-    with open(model_path, "wb") as f:
-        shutil.copyfileobj(model_file.file, f)
+    index_path = user_dir / f"{character_id}.index"
+    staged: dict[Path, Path] = {}
+    try:
+        staged[await run_in_threadpool(_stage_upload, model_file, model_path)] = model_path
+        if has_index:
+            staged[await run_in_threadpool(_stage_upload, index_file, index_path)] = index_path
+    except Exception:
+        await run_in_threadpool(_remove_files, *(str(tmp) for tmp in staged))
+        raise
     
-    character.rvc_model_path = str(model_path)
+    # Move the new files into place, then delete old files they didn't overwrite
+    await run_in_threadpool(
+        _replace_voice_files, staged, (character.rvc_model_path, character.rvc_index_path)
+    )
     
-    # Save index file if provided
-    if index_file and index_file.filename:
-        if not index_file.filename.endswith(".index"):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Index file must be a .index file",
-            )
-        
-        index_path = user_dir / f"{character_id}.index"
-        with open(index_path, "wb") as f:
-            shutil.copyfileobj(index_file.file, f)
-        
-        character.rvc_index_path = str(index_path)
+    character.rvc_model_path = str(model_path)
+    # Without a new index the old one was removed above; don't leave a dangling path.
+    character.rvc_index_path = str(index_path) if has_index else None
     
     await session.commit()
     await session.refresh(character)
@@ -322,8 +363,7 @@ async def upload_character_avatar(
     filename = f"{character_id}{ext}"
     target = AVATAR_UPLOAD_DIR / filename
 
-    with open(target, "wb") as f:
-        shutil.copyfileobj(avatar_file.file, f)
+    await run_in_threadpool(_save_upload, avatar_file, target)
 
     character.avatar_url = f"/avatars/{filename}"
     await session.commit()
@@ -5,11 +5,10 @@ from __future__ import annotations
 from typing import Any
 from uuid import UUID
 
-import httpx
 from fastapi import APIRouter, Depends
 from loguru import logger
 
-from .orchestrator import get_orchestrator_url
+from .orchestrator import get_http_client, get_orchestrator_url
 
 from .auth import get_user_id
 
@@ -46,23 +45,22 @@ async def list_rvc_models(
 
     # Best-effort: ask the GPU server / orchestrator for available RVC models.
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(f"{ORCHESTRATOR_URL}/rvc-models")
-            if response.status_code == 200:
-                core_models = response.json()
-                for model in core_models:
-                    model_name = model.get("name", "")
-                    pth_file = model.get("pth_file", "")
-                    index_file = model.get("index_file")
-                    if model_name and pth_file:
-                        models.append(
-                            {
-                                "name": model_name,
-                                "model_path": f"rvc_models/{model_name}/{pth_file}",
-                                "index_path": f"rvc_models/{model_name}/{index_file}" if index_file else None,
-                                "description": f"RVC model: {model_name}",
-                            }
-                        )
+        response = await get_http_client().get(f"{ORCHESTRATOR_URL}/rvc-models", timeout=10.0)
+        if response.status_code == 200:
+            core_models = response.json()
+            for model in core_models:
+                model_name = model.get("name", "")
+                pth_file = model.get("pth_file", "")
+                index_file = model.get("index_file")
+                if model_name and pth_file:
+                    models.append(
+                        {
+                            "name": model_name,
+                            "model_path": f"rvc_models/{model_name}/{pth_file}",
+                            "index_path": f"rvc_models/{model_name}/{index_file}" if index_file else None,
+                            "description": f"RVC model: {model_name}",
+                        }
+                    )
     except Exception as e:
         logger.warning(f"Failed to fetch RVC models from orchestrator: {e}")
 
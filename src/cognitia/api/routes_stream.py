@@ -15,7 +15,6 @@ from collections.abc import AsyncIterator
 from typing import Any, Optional
 from uuid import UUID
 
-import httpx
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.responses import StreamingResponse
 from loguru import logger
@@ -26,10 +25,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from .auth import get_user_id
 from .database import Character, Chat, Message, get_session
 from .llm_fallback import stream_ollama_response
-from .orchestrator import get_orchestrator_url
+from .orchestrator import _json_dumpb, _json_loads, get_http_client, get_orchestrator_url
 from .streams import publisher
 
 
+ORCHESTRATOR_URL = get_orchestrator_url()
+
 router = APIRouter(prefix="/chat", tags=["chat"])
 
 
@@ -40,25 +41,26 @@ class ChatStreamRequest(BaseModel):
     prefer_orchestrator: bool = True
 
 
-_SENTENCE_RE = re.compile(r"(?s)(.*?)([.!?]+\s+|\n+)")
+_SENTENCE_END_RE = re.compile(r"[.!?]+\s+|\n+")
+# A sentence boundary can only complete on a token containing one of these, or
+# on any token following a buffer that ends in one (the trailing whitespace).
+_SENTENCE_END_CHARS = frozenset(".!?\n")
 
 
 def _sse(event: str, data: dict[str, Any]) -> bytes:
-    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n".encode("utf-8")
+    return b"".join((b"event: ", event.encode("utf-8"), b"\ndata: ", _json_dumpb(data), b"\n\n"))
 
 
-def _iter_sentences(text: str) -> list[str]:
+def _split_sentences(text: str) -> tuple[list[str], str]:
+    """Split completed sentences off ``text`` in one pass; return them and the unfinished tail."""
     sentences: list[str] = []
-    buf = text
-    while True:
-        match = _SENTENCE_RE.match(buf)
-        if match is None:
-            break
-        head = (match.group(1) + match.group(2)).strip()
+    start = 0
+    for match in _SENTENCE_END_RE.finditer(text):
+        head = text[start : match.end()].strip()
         if head:
             sentences.append(head)
-        buf = buf[match.end() :]
-    return sentences
+        start = match.end()
+    return sentences, text[start:]
 
 
 async def _load_chat_context(
@@ -69,20 +71,16 @@ async def _load_chat_context(
     session: AsyncSession,
     limit_messages: int = 10,
 ) -> tuple[str, list[dict[str, str]]]:
-    # Verify chat ownership (via character)
+    # Verify chat ownership (via character) and load the character in the same round trip
     result = await session.execute(
-        select(Chat)
-        .join(Character)
+        select(Character)
+        .join(Chat, Chat.character_id == Character.id)
         .where(Chat.id == chat_id, Chat.character_id == character_id, Character.user_id == user_id)
     )
-    chat = result.scalar_one_or_none()
-    if chat is None:
+    character = result.scalar_one_or_none()
+    if character is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Chat not found")
 
-    character = await session.get(Character, character_id)
-    if character is None or character.user_id != user_id:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Character not found")
-
     msgs_result = await session.execute(
         select(Message)
         .where(Message.chat_id == chat_id)
@@ -120,25 +118,25 @@ async def _stream_from_orchestrator(
         "history": history,
     }
 
-    async with httpx.AsyncClient(timeout=None) as client:
-        async with client.stream("POST", endpoint, json=payload) as resp:
-            if resp.status_code >= 400:
-                body = await resp.aread()
-                raise RuntimeError(f"orchestrator stream failed {resp.status_code}: {body[:200]!r}")
-
-            async for line in resp.aiter_lines():
-                if not line:
-                    continue
-                try:
-                    data = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-                if data.get("type") == "token":
-                    text = str(data.get("text", ""))
-                    if text:
-                        yield text
-                elif data.get("type") == "done":
-                    break
+    async with get_http_client().stream("POST", endpoint, json=payload) as resp:
+        if resp.status_code >= 400:
+            body = await resp.aread()
+            raise RuntimeError(f"orchestrator stream failed {resp.status_code}: {body[:200]!r}")
+
+        async for line in resp.aiter_lines():
+            if not line:
+                continue
+            try:
+                data = _json_loads(line)
+            except json.JSONDecodeError:
+                continue
+            kind = data.get("type")
+            if kind == "token":
+                text = data.get("text")
+                if text:
+                    yield text if isinstance(text, str) else str(text)
+            elif kind == "done":
+                break
 
 
 @router.post("/stream")
@@ -163,10 +161,8 @@ async def chat_stream(
         session=session,
     )
 
-    orchestrator_url = get_orchestrator_url()
-
     async def gen() -> AsyncIterator[bytes]:
-        full_text = ""
+        full_text_parts: list[str] = []
         buffer = ""
         used_orchestrator = False
 
@@ -178,7 +174,7 @@ async def chat_stream(
             if prefer_orchestrator:
                 try:
                     token_stream = _stream_from_orchestrator(
-                        orchestrator_url=orchestrator_url,
+                        orchestrator_url=ORCHESTRATOR_URL,
                         user_id=str(user_id),
                         chat_id=str(chat_id),
                         character_id=str(character_id),
@@ -192,31 +188,24 @@ async def chat_stream(
                     token_stream = None
 
             if token_stream is None:
-                token_stream = stream_ollama_response(history + [{"role": "user", "content": user_text}], system_prompt)
+                # history is this request's own list; extend it rather than concatenating a copy.
+                history.append({"role": "user", "content": user_text})
+                token_stream = stream_ollama_response(history, system_prompt)
 
             async for token in token_stream:
-                full_text += token
+                full_text_parts.append(token)
+                pending_end = buffer[-1:] in _SENTENCE_END_CHARS
                 buffer += token
-                sentences = _iter_sentences(buffer)
-                if sentences:
-                    # Drain buffer by repeatedly consuming matches.
-                    for s in sentences:
-                        yield _sse("sentence", {"text": s})
-                    # Recompute remainder by removing all sentence-matched prefixes.
-                    # (This is cheap because buffer is relatively small.)
-                    remainder = buffer
-                    while True:
-                        m = _SENTENCE_RE.match(remainder)
-                        if m is None:
-                            break
-                        remainder = remainder[m.end() :]
-                    buffer = remainder
+                if not pending_end and _SENTENCE_END_CHARS.isdisjoint(token):
+                    continue
+                sentences, buffer = _split_sentences(buffer)
+                for s in sentences:
+                    yield _sse("sentence", {"text": s})
 
             # Flush remainder
             remainder = buffer.strip()
             if remainder:
                 yield _sse("sentence", {"text": remainder})
-                full_text += ""  # already counted via tokens
 
             yield _sse("done", {"ok": True})
 
@@ -228,7 +217,7 @@ async def chat_stream(
                     character_id=str(character_id),
                     chat_id=str(chat_id),
                     user_text=user_text,
-                    assistant_text=full_text.strip(),
+                    assistant_text="".join(full_text_parts).strip(),
                     meta={"source": "ollama_fallback"},
                 )
 
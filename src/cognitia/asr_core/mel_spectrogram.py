@@ -532,7 +532,13 @@ class MelSpectrogramCalculator:
         """
         if self.preemph == 0.0 or len(audio) == 0:
             return audio
-        return np.concatenate([audio[:1], audio[1:] - self.preemph * audio[:-1]])
+        # Write straight into one preallocated output instead of building the
+        # filtered tail as a temporary and concatenating it onto the first sample.
+        out = np.empty_like(audio)
+        out[0] = audio[0]
+        np.multiply(audio[:-1], self.preemph, out=out[1:])
+        np.subtract(audio[1:], out[1:], out=out[1:])
+        return out
 
     def _normalize_spectrogram(self, mel_spec: NDArray[np.float32]) -> NDArray[np.float32]:
         """Applies per-feature normalization to the mel spectrogram."""
@@ -389,7 +389,7 @@ class AudioTranscriber:
         decoder_out, next_state0, next_state1 = self.model.run_decoder(last_emitted_token_for_decoder, state0, state1)
 
         current_t = 0
-        loop_start_time = time.time()
+        loop_start_time = time.perf_counter()
         max_steps = max_encoder_t * 2  # Safety break for potential infinite loops
         steps_taken = 0
 
@@ -440,7 +440,7 @@ class AudioTranscriber:
             # Advance time step based on predicted duration
             current_t += predicted_skip_amount
 
-        loop_end_time = time.time()
+        loop_end_time = time.perf_counter()
         logger.info(f"TDT decoding loop finished in {loop_end_time - loop_start_time:.2f}s ({steps_taken} steps).")
         if steps_taken >= max_steps:
             logger.warning("Warning: TDT decoding loop hit maximum step limit. Result might be truncated.")
@@ -479,35 +479,35 @@ class AudioTranscriber:
         Returns:
             str: Transcribed text.
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         audio_duration_sec = len(audio) / self.melspectrogram.sample_rate
 
         # 1. Preprocess audio -> Mel Spectrogram Features
         logger.info("Preprocessing audio...")
-        preprocessing_start = time.time()
+        preprocessing_start = time.perf_counter()
         features = self._process_audio(audio)
-        preprocessing_end = time.time()
+        preprocessing_end = time.perf_counter()
         logger.info(f"Preprocessing time: {preprocessing_end - preprocessing_start:.2f}s")
 
         # 2. Run Encoder
         logger.info("Running encoder...")
-        encoder_start = time.time()
+        encoder_start = time.perf_counter()
         encoder_out = self.model.run_encoder(features)
-        encoder_end = time.time()
+        encoder_end = time.perf_counter()
         logger.info(f"Encoder output shape: {encoder_out.shape}")  # [1, channels, time_reduced]
         logger.info(f"Encoder time: {encoder_end - encoder_start:.2f}s")
 
         # 3. Run TDT Decoding (Decoder + Joiner loop)
         logger.info("Running TDT decoding...")
-        decoder_start = time.time()
+        decoder_start = time.perf_counter()
         predicted_token_ids = self._decode_tdt(encoder_out)
-        decoder_end = time.time()
+        decoder_end = time.perf_counter()
         logger.info(f"Decoder time: {decoder_end - decoder_start:.2f}s")
 
         # 4. Post-process token IDs to text
         logger.info("Post-processing text...")
         text = self._post_process_text(predicted_token_ids)
-        end_time = time.time()
+        end_time = time.perf_counter()
         total_time = end_time - start_time
 
         logger.info(f"Total processing time: {total_time:.2f}s (Audio duration: {audio_duration_sec:.2f}s)")
@@ -25,6 +25,9 @@ from .schemas import HealthResponse, TokenRefresh, TokenResponse, UserCreate, Us
 
 ALGORITHM = "RS256"
 
+# Health is constant; build the response once instead of per probe.
+_HEALTH_OK = HealthResponse(status="ok")
+
 
 def _read_file(path: str) -> bytes:
     with open(path, "rb") as f:
@@ -62,7 +65,7 @@ def create_app() -> FastAPI:
 
     @app.get("/health", response_model=HealthResponse)
     async def health() -> HealthResponse:
-        return HealthResponse(status="ok")
+        return _HEALTH_OK
 
     @app.get("/.well-known/jwks.json")
     async def jwks():
@@ -41,6 +41,10 @@ class Settings(BaseSettings):
     # Persona storage
     PERSONA_STORAGE_DIR: str = "./personas"
 
+    # CORS. The memory service is only called server-to-server (API, orchestrator,
+    # memory-worker), so the middleware is off unless a browser needs direct access.
+    ENABLE_CORS: bool = False
+
     class Config:
         env_file = ".env"
 
@@ -9,6 +9,11 @@ import httpx
 
 logger = logging.getLogger(__name__)
 
+_CODE_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.DOTALL | re.IGNORECASE)
+_BLOCK_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+_LINE_COMMENT_RE = re.compile(r"(^|\s)//.*?$", re.MULTILINE)
+_TRAILING_COMMA_RE = re.compile(r",\s*([}\]])")
+
 
 async def call_ollama(
     prompt: str,
@@ -126,7 +131,7 @@ def _extract_json_like(text: str, *, want: str) -> Optional[str]:
     if want not in {"object", "array"}:
         raise ValueError("want must be 'object' or 'array'")
 
-    fence_match = re.search(r"```(?:json)?\s*(.*?)\s*```", text, re.DOTALL | re.IGNORECASE)
+    fence_match = _CODE_FENCE_RE.search(text)
     candidate_source = fence_match.group(1) if fence_match else text
 
     open_char = "{" if want == "object" else "["
@@ -186,14 +191,14 @@ def _parse_json_relaxed(json_text: str) -> Any:
 
     repaired = json_text
     # Remove /* ... */ block comments
-    repaired = re.sub(r"/\*.*?\*/", "", repaired, flags=re.DOTALL)
+    repaired = _BLOCK_COMMENT_RE.sub("", repaired)
     # Remove // line comments
-    repaired = re.sub(r"(^|\s)//.*?$", r"\1", repaired, flags=re.MULTILINE)
+    repaired = _LINE_COMMENT_RE.sub(r"\1", repaired)
     # Remove trailing commas
     prev = None
     while prev != repaired:
         prev = repaired
-        repaired = re.sub(r",\s*([}\]])", r"\1", repaired)
+        repaired = _TRAILING_COMMA_RE.sub(r"\1", repaired)
 
     try:
         return json.loads(repaired)
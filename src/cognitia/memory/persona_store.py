@@ -4,6 +4,7 @@ import json
 import logging
 import os
 from datetime import datetime
+from pathlib import Path
 from typing import Any, Dict, Optional
 
 from .config import settings
@@ -94,9 +95,12 @@ class PersonaStore:
                 "episodes_used": len(episodes),
             }
 
+            # Serialize up front, then write to a temp file and atomically swap it in so
+            # concurrent readers never observe a partially written persona.
             persona_path = self._get_persona_path(user_id, character_id)
-            with open(persona_path, "w") as f:
-                json.dump(persona_data, f, indent=2)
+            tmp_path = Path(f"{persona_path}.tmp")
+            tmp_path.write_bytes(json.dumps(persona_data, indent=2).encode("utf-8"))
+            os.replace(tmp_path, persona_path)
 
             logger.info(f"Persona saved to {persona_path}")
             return persona
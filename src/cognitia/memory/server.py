@@ -1,6 +1,7 @@
 """FastAPI server for Cognitia Memory Add-on Service."""
 
 import logging
+import re
 from contextlib import asynccontextmanager
 from datetime import datetime
 from typing import Any, Optional
@@ -34,6 +35,8 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+_CAPITALIZED_WORD_RE = re.compile(r"\b[A-Z][a-z]+\b")
+
 # Global clients (initialized on startup)
 graphiti_client: Optional[Any] = None
 qdrant_client: Optional[Any] = None
@@ -123,14 +126,15 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
-# CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# CORS middleware (opt-in; see settings.ENABLE_CORS)
+if settings.ENABLE_CORS:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
 
 
 @app.get("/health", response_model=HealthResponse)
@@ -403,8 +407,7 @@ async def retrieve_memory(request: RetrieveRequest):
         if graphiti_client and request.query:
             try:
                 # Simple entity detection - look for capitalized words that might be names
-                import re
-                potential_names = re.findall(r'\b[A-Z][a-z]+\b', request.query)
+                potential_names = _CAPITALIZED_WORD_RE.findall(request.query)
 
                 if potential_names:
                     for name in potential_names[:2]:  # Limit to 2 names
@@ -17,7 +17,7 @@ import asyncio
 import json
 import os
 from pathlib import Path
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Iterable
 from datetime import datetime, timezone
 from typing import Any, Optional
 
@@ -34,6 +34,19 @@ except Exception:  # pragma: no cover
     redis = None  # type: ignore
     REDIS_AVAILABLE = False
 
+try:
+    import orjson  # type: ignore[import-not-found]
+
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers keep
+    # catching the stdlib exception either way.
+    _json_loads = orjson.loads
+    _json_dumpb = orjson.dumps  # UTF-8 bytes, non-ASCII unescaped
+except Exception:  # pragma: no cover
+    _json_loads = json.loads
+
+    def _json_dumpb(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
 
 MEMORY_SERVICE_URL = os.getenv("MEMORY_SERVICE_URL", "http://127.0.0.1:8002").rstrip("/")
 MEMORY_RETRIEVE_LIMIT = int(os.getenv("MEMORY_RETRIEVE_LIMIT", "8"))
@@ -44,19 +57,96 @@ MEMORY_UPDATE_STREAM = os.getenv("MEMORY_UPDATE_STREAM", "cognitia:memory_update
 
 RVC_MODELS_DIR = Path(os.getenv("RVC_MODELS_DIR", "./rvc_models"))
 
+# Shared upstream client pool: each streamed reply holds a connection for its whole
+# duration, so size the pool explicitly and bound the wait for a free connection.
+HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "200"))
+HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "20"))
+HTTP_POOL_TIMEOUT = float(os.getenv("HTTP_POOL_TIMEOUT", "10"))
+
+
+def _get_int(name: str, default: int) -> int:
+    raw = os.getenv(name)
+    if raw is None or raw == "":
+        return default
+    try:
+        return int(raw)
+    except Exception:
+        return default
+
+
+def _get_float(name: str, default: float) -> float:
+    raw = os.getenv(name)
+    if raw is None or raw == "":
+        return default
+    try:
+        return float(raw)
+    except Exception:
+        return default
+
+
+OLLAMA_URL = os.getenv("OLLAMA_URL", "http://127.0.0.1:11434").rstrip("/")
+OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "llama3.2:3b")
+OLLAMA_CHAT_URL = f"{OLLAMA_URL}/api/chat"
+MEMORY_RETRIEVE_URL = f"{MEMORY_SERVICE_URL}/retrieve"
+
+# Default sampling tuned to reduce repetition while keeping responses natural.
+# Can be overridden via env vars; resolved once at import like the rest of the config.
+OLLAMA_OPTIONS: dict[str, Any] = {
+    "temperature": _get_float("OLLAMA_TEMPERATURE", 0.7),
+    "top_p": _get_float("OLLAMA_TOP_P", 0.9),
+    "top_k": _get_int("OLLAMA_TOP_K", 40),
+    "repeat_penalty": _get_float("OLLAMA_REPEAT_PENALTY", 1.15),
+    "repeat_last_n": _get_int("OLLAMA_REPEAT_LAST_N", 128),
+}
+_num_ctx = _get_int("OLLAMA_NUM_CTX", 0)
+if _num_ctx:
+    OLLAMA_OPTIONS["num_ctx"] = _num_ctx
+# Prompt-eval batch size; larger values help when several chats hit Ollama at once.
+_num_batch = _get_int("OLLAMA_NUM_BATCH", 0)
+if _num_batch:
+    OLLAMA_OPTIONS["num_batch"] = _num_batch
+
+# Per-turn requests shallow-copy this and only fill in "messages".
+_OLLAMA_REQUEST_TEMPLATE: dict[str, Any] = {
+    "model": OLLAMA_MODEL,
+    "stream": True,
+    "options": OLLAMA_OPTIONS,
+}
+
 
 class _State:
     def __init__(self) -> None:
         self.redis: Any = None
+        self.http: httpx.AsyncClient | None = None
+        # /rvc-models listing, keyed on the mtimes of RVC_MODELS_DIR and its model dirs.
+        self.rvc_models_key: tuple[Any, ...] | None = None
+        self.rvc_models: list[dict[str, Any]] = []
 
 
 state = _State()
 
 
+def _get_http() -> httpx.AsyncClient:
+    """Return the shared upstream client, creating it on first use."""
+    if state.http is None:
+        state.http = httpx.AsyncClient(
+            timeout=httpx.Timeout(None, pool=HTTP_POOL_TIMEOUT),
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            ),
+        )
+    return state.http
+
+
 class HealthResponse(BaseModel):
     status: str = "ok"
 
 
+# Health is constant; build the response once instead of per probe.
+_HEALTH_OK = HealthResponse(status="ok")
+
+
 class ChatStreamRequest(BaseModel):
     user_id: str
     chat_id: str
@@ -67,7 +157,66 @@ class ChatStreamRequest(BaseModel):
 
 
 def _ndjson(obj: dict[str, Any]) -> bytes:
-    return (json.dumps(obj, ensure_ascii=False) + "\n").encode("utf-8")
+    return _json_dumpb(obj) + b"\n"
+
+
+def _first_model_files(model_dir: str) -> tuple[str | None, str | None]:
+    """Return the first .pth and .index file names in one directory read."""
+    pth: str | None = None
+    index: str | None = None
+    with os.scandir(model_dir) as it:
+        for entry in it:
+            ext = os.path.splitext(entry.name)[1].lower()
+            if ext == ".pth":
+                if (pth is None or entry.name < pth) and entry.is_file():
+                    pth = entry.name
+            elif ext == ".index":
+                if (index is None or entry.name < index) and entry.is_file():
+                    index = entry.name
+    return pth, index
+
+
+def _rvc_models_key(base: Path) -> tuple[Any, ...] | None:
+    """Cheap change key for /rvc-models: the base dir mtime plus each model dir's mtime.
+
+    Adding/removing a model dir bumps the base mtime; adding/removing/renaming a
+    .pth/.index inside one bumps that dir's mtime. Returns None if base is missing.
+    """
+    try:
+        base_mtime = os.stat(base).st_mtime_ns
+        with os.scandir(base) as it:
+            dirs = tuple(
+                sorted((entry.name, entry.stat().st_mtime_ns) for entry in it if entry.is_dir())
+            )
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    return (base_mtime, dirs)
+
+
+def _scan_rvc_models(base: Path) -> list[dict[str, Any]]:
+    """Blocking directory scan backing /rvc-models (run in a worker thread)."""
+    try:
+        with os.scandir(base) as it:
+            model_dirs = [entry for entry in it if entry.is_dir()]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+    models: list[dict[str, Any]] = []
+
+    for model_dir in sorted(model_dirs, key=lambda e: e.name.lower()):
+        pth_file, index_file = _first_model_files(model_dir.path)
+        if pth_file is None:
+            continue
+
+        models.append(
+            {
+                "name": model_dir.name,
+                "pth_file": pth_file,
+                "index_file": index_file,
+            }
+        )
+
+    return models
 
 
 async def _publish_memory_update(*, user_id: str, chat_id: str, character_id: str, user_text: str, assistant_text: str) -> None:
@@ -107,69 +256,47 @@ async def _publish_memory_update(*, user_id: str, chat_id: str, character_id: st
                 return
 
 
-async def _ollama_token_stream(*, system_prompt: str, history: list[dict[str, Any]]) -> AsyncIterator[str]:
-    ollama_url = os.getenv("OLLAMA_URL", "http://127.0.0.1:11434").rstrip("/")
-    ollama_model = os.getenv("OLLAMA_MODEL", "llama3.2:3b")
-
-    def _get_int(name: str, default: int) -> int:
-        raw = os.getenv(name)
-        if raw is None or raw == "":
-            return default
-        try:
-            return int(raw)
-        except Exception:
-            return default
-
-    def _get_float(name: str, default: float) -> float:
-        raw = os.getenv(name)
-        if raw is None or raw == "":
-            return default
-        try:
-            return float(raw)
-        except Exception:
-            return default
-
-    # Default sampling tuned to reduce repetition while keeping responses natural.
-    # Can be overridden via env vars.
-    options: dict[str, Any] = {
-        "temperature": _get_float("OLLAMA_TEMPERATURE", 0.7),
-        "top_p": _get_float("OLLAMA_TOP_P", 0.9),
-        "top_k": _get_int("OLLAMA_TOP_K", 40),
-        "repeat_penalty": _get_float("OLLAMA_REPEAT_PENALTY", 1.15),
-        "repeat_last_n": _get_int("OLLAMA_REPEAT_LAST_N", 128),
-    }
-
-    num_ctx_raw = os.getenv("OLLAMA_NUM_CTX")
-    if num_ctx_raw:
+def _parse_ollama_lines(lines: Iterable[bytes]) -> tuple[list[str], bool]:
+    """Collect message content from Ollama NDJSON lines; stop at the ``done`` frame."""
+    parts: list[str] = []
+    for line in lines:
+        if not line:
+            continue
         try:
-            options["num_ctx"] = int(num_ctx_raw)
-        except Exception:
-            pass
-
-    payload = {
-        "model": ollama_model,
-        "messages": [{"role": "system", "content": system_prompt}] + history,
-        "stream": True,
-        "options": options,
-    }
-
-    async with httpx.AsyncClient(timeout=None) as client:
-        async with client.stream("POST", f"{ollama_url}/api/chat", json=payload) as resp:
-            if resp.status_code >= 400:
-                body = await resp.aread()
-                raise HTTPException(status_code=502, detail=f"Ollama error: {body[:200]!r}")
-            async for line in resp.aiter_lines():
-                if not line:
-                    continue
-                try:
-                    data = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-                content = data.get("message", {}).get("content", "")
-                if content:
-                    yield content
-                if data.get("done"):
-                    break
+            data = _json_loads(line)
+        except json.JSONDecodeError:
+            continue
+        content = data.get("message", {}).get("content", "")
+        if content:
+            parts.append(content)
+        if data.get("done"):
+            return parts, True
+    return parts, False
+
+
+async def _ollama_token_stream(*, messages: list[dict[str, Any]]) -> AsyncIterator[str]:
+    payload = dict(_OLLAMA_REQUEST_TEMPLATE)
+    payload["messages"] = messages
+
+    async with _get_http().stream("POST", OLLAMA_CHAT_URL, json=payload) as resp:
+        if resp.status_code >= 400:
+            body = await resp.aread()
+            raise HTTPException(status_code=502, detail=f"Ollama error: {body[:200]!r}")
+        # Split NDJSON on raw bytes; both parsers accept bytes, so skip the str decode.
+        # Tokens that arrive in the same network read are coalesced into one yield,
+        # so a burst becomes one downstream frame instead of one per token.
+        pending = b""
+        async for chunk in resp.aiter_bytes():
+            *lines, pending = (pending + chunk).split(b"\n")
+            parts, done = _parse_ollama_lines(lines)
+            if parts:
+                yield parts[0] if len(parts) == 1 else "".join(parts)
+            if done:
+                return
+        # Like aiter_lines, don't drop a final frame that lacks its trailing newline.
+        parts, _ = _parse_ollama_lines((pending,))
+        if parts:
+            yield "".join(parts)
 
 
 async def _retrieve_memory_context(*, user_id: str, character_id: str, query: str) -> str:
@@ -185,20 +312,19 @@ async def _retrieve_memory_context(*, user_id: str, character_id: str, query: st
     }
 
     try:
-        async with httpx.AsyncClient(timeout=8.0) as client:
-            resp = await client.post(f"{MEMORY_SERVICE_URL}/retrieve", json=payload)
-            if resp.status_code >= 400:
-                return ""
-            data = resp.json()
-            context = data.get("context")
-            if not isinstance(context, str):
-                return ""
-            context = context.strip()
-            if not context:
-                return ""
-            if len(context) > MEMORY_CONTEXT_MAX_CHARS:
-                context = context[:MEMORY_CONTEXT_MAX_CHARS]
-            return context
+        resp = await _get_http().post(MEMORY_RETRIEVE_URL, json=payload, timeout=8.0)
+        if resp.status_code >= 400:
+            return ""
+        data = resp.json()
+        context = data.get("context")
+        if not isinstance(context, str):
+            return ""
+        context = context.strip()
+        if not context:
+            return ""
+        if len(context) > MEMORY_CONTEXT_MAX_CHARS:
+            context = context[:MEMORY_CONTEXT_MAX_CHARS]
+        return context
     except Exception:
         return ""
 
@@ -208,6 +334,7 @@ def create_app() -> FastAPI:
 
     @app.on_event("startup")
     async def _startup() -> None:
+        _get_http()
         if not REDIS_AVAILABLE or redis is None:
             state.redis = None
             return
@@ -219,6 +346,9 @@ def create_app() -> FastAPI:
 
     @app.on_event("shutdown")
     async def _shutdown() -> None:
+        if state.http is not None:
+            await state.http.aclose()
+            state.http = None
         if state.redis is not None:
             try:
                 await state.redis.close()
@@ -227,7 +357,7 @@ def create_app() -> FastAPI:
 
     @app.get("/health", response_model=HealthResponse)
     async def health() -> HealthResponse:
-        return HealthResponse(status="ok")
+        return _HEALTH_OK
 
     @app.get("/rvc-models")
     async def list_rvc_models() -> list[dict[str, Any]]:
@@ -236,34 +366,22 @@ def create_app() -> FastAPI:
         Response contract consumed by API [src/cognitia/api/routes_models.py]:
         [{"name": "<dir>", "pth_file": "<file.pth>", "index_file": "<file.index>|None"}, ...]
         """
-        base = RVC_MODELS_DIR
-        if not base.exists() or not base.is_dir():
+        key = await asyncio.to_thread(_rvc_models_key, RVC_MODELS_DIR)
+        if key is None:
             return []
 
-        models: list[dict[str, Any]] = []
-
-        for model_dir in sorted([p for p in base.iterdir() if p.is_dir()], key=lambda p: p.name.lower()):
-            pth_files = sorted([p for p in model_dir.iterdir() if p.is_file() and p.suffix.lower() == ".pth"])
-            if not pth_files:
-                continue
-
-            index_files = sorted([p for p in model_dir.iterdir() if p.is_file() and p.suffix.lower() == ".index"])
-
-            models.append(
-                {
-                    "name": model_dir.name,
-                    "pth_file": pth_files[0].name,
-                    "index_file": index_files[0].name if index_files else None,
-                }
-            )
-
-        return models
+        # Only rescan when a model dir or its file list changed since the last scan.
+        if key != state.rvc_models_key:
+            state.rvc_models = await asyncio.to_thread(_scan_rvc_models, RVC_MODELS_DIR)
+            state.rvc_models_key = key
+        return state.rvc_models
 
     @app.post("/v1/chat/stream")
     async def chat_stream(req: ChatStreamRequest):
         system_prompt = req.system_prompt or "You are a helpful AI assistant."
-        history: list[dict[str, Any]] = list(req.history or [])
-        history.append({"role": "user", "content": req.message})
+        # The validated request owns a fresh list already; build the prompt in it instead of copying.
+        messages: list[dict[str, Any]] = req.history if req.history is not None else []
+        messages.append({"role": "user", "content": req.message})
 
         memory_context = await _retrieve_memory_context(
             user_id=req.user_id,
@@ -272,17 +390,15 @@ def create_app() -> FastAPI:
         )
         if memory_context:
             system_prompt = (
-                system_prompt
-                + "\n\nUse the following memory context when relevant."
-                + "\n[MEMORY CONTEXT]\n"
-                + memory_context
-                + "\n[/MEMORY CONTEXT]\n"
+                f"{system_prompt}\n\nUse the following memory context when relevant.\n"
+                f"[MEMORY CONTEXT]\n{memory_context}\n[/MEMORY CONTEXT]\n"
             )
+        messages.insert(0, {"role": "system", "content": system_prompt})
 
         async def gen() -> AsyncIterator[bytes]:
             assistant_text_parts: list[str] = []
             try:
-                async for token in _ollama_token_stream(system_prompt=system_prompt, history=history):
+                async for token in _ollama_token_stream(messages=messages):
                     assistant_text_parts.append(token)
                     yield _ndjson({"type": "token", "text": token})
                 yield _ndjson({"type": "done"})
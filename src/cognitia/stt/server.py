@@ -3,32 +3,43 @@
 GPU-hosted speech-to-text using the ported legacy ONNX ASR pipelines.
 
 Input/Output:
-- Request accepts base64-encoded audio (WAV recommended).
+- Request accepts base64-encoded audio (WAV recommended), or the raw audio file
+  as the request body on /v1/transcribe/raw.
 - Response returns recognized text.
 
 Env:
 - STT_ENGINE: asr engine type (ctc|tdt)
 - COGNITIA_RESOURCES_ROOT: base directory containing models/... (see cognitia.utils.resources)
+- STT_THREAD_POOL_SIZE: worker threads for blocking decode/inference (default: anyio's 40)
 """
 
 from __future__ import annotations
 
-import base64
+import binascii
 import io
 import os
+import threading
+from typing import Any
 
+import anyio.to_thread
 import numpy as np
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from pydantic import BaseModel
 from starlette.concurrency import run_in_threadpool
 
 from ..asr_core import get_audio_transcriber
 
+STT_THREAD_POOL_SIZE = int(os.getenv("STT_THREAD_POOL_SIZE", "0"))
+
 
 class HealthResponse(BaseModel):
     status: str = "ok"
 
 
+# Health is constant; build the response once instead of per probe.
+_HEALTH_OK = HealthResponse(status="ok")
+
+
 class TranscribeRequest(BaseModel):
     # Placeholder contract; actual implementation will likely accept
     # multipart audio or an object-store URL.
@@ -40,13 +51,77 @@ class TranscribeResponse(BaseModel):
     text: str
 
 
+class _State:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._transcriber_by_engine: dict[str, Any] = {}
+
+
+state = _State()
+
+
+def _get_transcriber(engine: str) -> Any:
+    """Return the transcriber for an engine, loading its ONNX models once."""
+    key = engine.lower()
+    transcriber = state._transcriber_by_engine.get(key)
+    if transcriber is not None:
+        return transcriber
+    with state._lock:
+        transcriber = state._transcriber_by_engine.get(key)
+        if transcriber is None:
+            transcriber = get_audio_transcriber(engine_type=key)
+            state._transcriber_by_engine[key] = transcriber
+        return transcriber
+
+
+async def _transcribe_bytes(raw: bytes, engine_name: str | None) -> TranscribeResponse:
+    """Decode an audio file and run ASR; shared by the base64 and raw-body endpoints."""
+
+    def _decode() -> tuple[np.ndarray, int]:
+        import soundfile as sf  # type: ignore
+
+        audio, sr = sf.read(io.BytesIO(raw), dtype="float32", always_2d=True)
+        audio = audio[:, 0]
+        return audio, int(sr)
+
+    try:
+        audio, sr = await run_in_threadpool(_decode)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Failed to decode audio: {e}") from e
+
+    engine = (engine_name or os.getenv("STT_ENGINE") or "ctc").strip() or "ctc"
+
+    def _run_asr() -> str:
+        transcriber = _get_transcriber(engine)
+        # The legacy ASR pipeline expects a specific sample rate from its YAML config.
+        expected_sr = getattr(getattr(transcriber, "melspectrogram", None), "sample_rate", None)
+        if expected_sr is not None and int(expected_sr) != int(sr):
+            raise ValueError(f"Sample rate mismatch: expected {expected_sr}Hz, got {sr}")
+        audio_np = np.asarray(audio, dtype=np.float32)
+        return str(transcriber.transcribe(audio_np))
+
+    try:
+        text = await run_in_threadpool(_run_asr)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Transcription failed: {e}") from e
+
+    return TranscribeResponse(text=text)
+
+
 def create_app() -> FastAPI:
     app = FastAPI(title="Cognitia STT", version="0.1.0")
 
+    @app.on_event("startup")
+    async def _startup() -> None:
+        # run_in_threadpool draws from anyio's default limiter; size it for this host.
+        if STT_THREAD_POOL_SIZE > 0:
+            anyio.to_thread.current_default_thread_limiter().total_tokens = STT_THREAD_POOL_SIZE
+
     @app.get("/health", response_model=HealthResponse)
     async def health() -> HealthResponse:
-        _ = os.getenv("STT_ENGINE", "")
-        return HealthResponse(status="ok")
+        return _HEALTH_OK
 
     @app.post("/v1/transcribe", response_model=TranscribeResponse)
     async def transcribe(req: TranscribeRequest) -> TranscribeResponse:
@@ -54,41 +129,21 @@ def create_app() -> FastAPI:
             raise HTTPException(status_code=400, detail="audio_b64 is required")
 
         try:
-            raw = base64.b64decode(req.audio_b64)
+            # Same decoder base64.b64decode wraps, minus its str->bytes re-encode step.
+            # Multi-MB payloads: decode off the event loop.
+            raw = await run_in_threadpool(binascii.a2b_base64, req.audio_b64)
         except Exception as e:
             raise HTTPException(status_code=400, detail=f"Invalid base64 audio: {e}") from e
 
-        def _decode() -> tuple[np.ndarray, int]:
-            import soundfile as sf  # type: ignore
-
-            audio, sr = sf.read(io.BytesIO(raw), dtype="float32", always_2d=True)
-            audio = audio[:, 0]
-            return audio, int(sr)
-
-        try:
-            audio, sr = await run_in_threadpool(_decode)
-        except Exception as e:
-            raise HTTPException(status_code=400, detail=f"Failed to decode audio: {e}") from e
-
-        engine = (req.engine or os.getenv("STT_ENGINE") or "ctc").strip() or "ctc"
-
-        def _run_asr() -> str:
-            transcriber = get_audio_transcriber(engine_type=engine)
-            # The legacy ASR pipeline expects a specific sample rate from its YAML config.
-            expected_sr = getattr(getattr(transcriber, "melspectrogram", None), "sample_rate", None)
-            if expected_sr is not None and int(expected_sr) != int(sr):
-                raise ValueError(f"Sample rate mismatch: expected {expected_sr}Hz, got {sr}")
-            audio_np = np.asarray(audio, dtype=np.float32)
-            return str(transcriber.transcribe(audio_np))
-
-        try:
-            text = await run_in_threadpool(_run_asr)
-        except ValueError as e:
-            raise HTTPException(status_code=400, detail=str(e)) from e
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Transcription failed: {e}") from e
+        return await _transcribe_bytes(raw, req.engine)
 
-        return TranscribeResponse(text=text)
+    @app.post("/v1/transcribe/raw", response_model=TranscribeResponse)
+    async def transcribe_raw(request: Request, engine: str | None = None) -> TranscribeResponse:
+        """Same as /v1/transcribe, but the body is the audio file itself (no base64)."""
+        raw = await request.body()
+        if not raw:
+            raise HTTPException(status_code=400, detail="audio body is required")
+        return await _transcribe_bytes(raw, engine)
 
     return app
 
@@ -4,11 +4,16 @@ GPU-hosted text-to-speech using the ported legacy ONNX pipelines.
 
 Input/Output:
 - Request accepts text and optional voice.
-- Response returns base64-encoded WAV (PCM16) + sample_rate.
+- /v1/synthesize returns base64-encoded WAV (PCM16) + sample_rate.
+- /v1/synthesize/wav returns the raw WAV bytes (audio/wav), with sample rate,
+  voice and RVC usage in X-Sample-Rate / X-Voice / X-Used-RVC headers.
 
 Env:
 - TTS_VOICE: default voice
 - COGNITIA_RESOURCES_ROOT: base directory containing models/... (see cognitia.utils.resources)
+- TTS_THREAD_POOL_SIZE: worker threads for blocking synthesis/RVC calls (default: anyio's 40)
+- TTS_SYNTH_CONCURRENCY: cap on concurrent synthesis calls, kept separate from the
+  shared pool so RVC/encoding work isn't starved behind them (default: unbounded)
 - RVC_SERVICE_URL: optional RVC microservice (default http://rvc:5050)
 """
 
@@ -21,8 +26,10 @@ import wave
 from io import BytesIO
 from typing import Any, Optional
 
+import anyio
+import anyio.to_thread
 import numpy as np
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
 from pydantic import BaseModel
 from starlette.concurrency import run_in_threadpool
 
@@ -37,10 +44,18 @@ except Exception:  # pragma: no cover
     _RVC_CLIENT_AVAILABLE = False
 
 
+TTS_THREAD_POOL_SIZE = int(os.getenv("TTS_THREAD_POOL_SIZE", "0"))
+TTS_SYNTH_CONCURRENCY = int(os.getenv("TTS_SYNTH_CONCURRENCY", "0"))
+
+
 class HealthResponse(BaseModel):
     status: str = "ok"
 
 
+# Health is constant; build the response once instead of per probe.
+_HEALTH_OK = HealthResponse(status="ok")
+
+
 class SynthesizeRequest(BaseModel):
     text: str
     voice: str | None = None
@@ -66,16 +81,20 @@ class _State:
     def __init__(self) -> None:
         self._lock = threading.Lock()
         self._synth_by_voice: dict[str, Any] = {}
+        # Set at startup when TTS_SYNTH_CONCURRENCY > 0; None uses the default limiter.
+        self.synth_limiter: anyio.CapacityLimiter | None = None
 
 
 state = _State()
 
 
 def _float32_to_wav_pcm16(audio: np.ndarray, sample_rate: int) -> bytes:
-    audio_1d = np.asarray(audio, dtype=np.float32).reshape(-1)
-    audio_1d = np.nan_to_num(audio_1d, nan=0.0, posinf=0.0, neginf=0.0)
-    audio_1d = np.clip(audio_1d, -1.0, 1.0)
-    pcm16 = (audio_1d * 32767.0).astype(np.int16)
+    # One owned float32 scratch copy, then sanitize/clip/scale it in place.
+    audio_1d = np.array(audio, dtype=np.float32).reshape(-1)
+    np.nan_to_num(audio_1d, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
+    np.clip(audio_1d, -1.0, 1.0, out=audio_1d)
+    audio_1d *= np.float32(32767.0)
+    pcm16 = audio_1d.astype(np.int16)
 
     buf = BytesIO()
     with wave.open(buf, "wb") as wf:
@@ -87,6 +106,10 @@ def _float32_to_wav_pcm16(audio: np.ndarray, sample_rate: int) -> bytes:
 
 
 def _get_synth(voice: str) -> Any:
+    # Lock-free fast path: entries are only ever added, never replaced.
+    synth = state._synth_by_voice.get(voice)
+    if synth is not None:
+        return synth
     with state._lock:
         synth = state._synth_by_voice.get(voice)
         if synth is None:
@@ -98,13 +121,19 @@ def _get_synth(voice: str) -> Any:
 def create_app() -> FastAPI:
     app = FastAPI(title="Cognitia TTS", version="0.1.0")
 
+    @app.on_event("startup")
+    async def _startup() -> None:
+        # run_in_threadpool draws from anyio's default limiter; size it for this host.
+        if TTS_THREAD_POOL_SIZE > 0:
+            anyio.to_thread.current_default_thread_limiter().total_tokens = TTS_THREAD_POOL_SIZE
+        if TTS_SYNTH_CONCURRENCY > 0:
+            state.synth_limiter = anyio.CapacityLimiter(TTS_SYNTH_CONCURRENCY)
+
     @app.get("/health", response_model=HealthResponse)
     async def health() -> HealthResponse:
-        _ = os.getenv("TTS_VOICE", "")
-        return HealthResponse(status="ok")
+        return _HEALTH_OK
 
-    @app.post("/v1/synthesize", response_model=SynthesizeResponse)
-    async def synthesize(req: SynthesizeRequest) -> SynthesizeResponse:
+    async def _synthesize_audio(req: SynthesizeRequest) -> tuple[np.ndarray, int, str, bool]:
         text = (req.text or "").strip()
         if not text:
             raise HTTPException(status_code=400, detail="text is required")
@@ -117,7 +146,7 @@ def create_app() -> FastAPI:
             sample_rate = int(getattr(synth, "sample_rate", 24000))
             return audio, sample_rate
 
-        audio, sample_rate = await run_in_threadpool(_run_tts)
+        audio, sample_rate = await anyio.to_thread.run_sync(_run_tts, limiter=state.synth_limiter)
 
         used_rvc = False
         if req.rvc_model_name and _RVC_CLIENT_AVAILABLE:
@@ -150,10 +179,36 @@ def create_app() -> FastAPI:
                 audio = converted
                 used_rvc = True
 
-        wav_bytes = _float32_to_wav_pcm16(audio, sample_rate)
-        audio_wav_b64 = base64.b64encode(wav_bytes).decode("utf-8")
+        return audio, sample_rate, voice, used_rvc
+
+    @app.post("/v1/synthesize", response_model=SynthesizeResponse)
+    async def synthesize(req: SynthesizeRequest) -> SynthesizeResponse:
+        audio, sample_rate, voice, used_rvc = await _synthesize_audio(req)
+
+        def _encode() -> str:
+            wav_bytes = _float32_to_wav_pcm16(audio, sample_rate)
+            return base64.b64encode(wav_bytes).decode("ascii")
+
+        # PCM packing + base64 are CPU-bound over the whole clip; keep them off the event loop.
+        audio_wav_b64 = await run_in_threadpool(_encode)
         return SynthesizeResponse(audio_wav_b64=audio_wav_b64, sample_rate=sample_rate, voice=voice, used_rvc=used_rvc)
 
+    @app.post("/v1/synthesize/wav")
+    async def synthesize_wav(req: SynthesizeRequest) -> Response:
+        # Same synthesis as /v1/synthesize, but skips the base64 round-trip (and its
+        # ~33% size overhead) for callers that can take a binary body.
+        audio, sample_rate, voice, used_rvc = await _synthesize_audio(req)
+        wav_bytes = await run_in_threadpool(_float32_to_wav_pcm16, audio, sample_rate)
+        return Response(
+            content=wav_bytes,
+            media_type="audio/wav",
+            headers={
+                "X-Sample-Rate": str(sample_rate),
+                "X-Voice": voice,
+                "X-Used-RVC": "true" if used_rvc else "false",
+            },
+        )
+
     return app
 
 
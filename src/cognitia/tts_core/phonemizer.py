@@ -14,6 +14,8 @@ import onnxruntime as ort  # type: ignore
 
 from ..utils.resources import resource_path
 
+_HYPHEN_SPLIT_RE = re.compile(r"([-])")
+
 # Default OnnxRuntime is way to verbose, only show fatal errors
 ort.set_default_logger_severity(4)
 
@@ -28,6 +30,7 @@ class ModelConfig:
     MODEL_INPUT_LENGTH: int = 64
     EXPAND_ACRONYMS: bool = False
     USE_CUDA: bool = True
+    PREDICTION_CACHE_SIZE: int = 4096
 
     def __init__(
         self,
@@ -188,6 +191,10 @@ class Phonemizer:
             SpecialTokens.EN_US.value,
         }
 
+        # Model predictions for out-of-dictionary words, reused across calls.
+        # Bounded by PREDICTION_CACHE_SIZE; cleared wholesale when full.
+        self._predicted_phonemes: dict[str, str] = {}
+
     @staticmethod
     def _load_pickle(path: Path) -> dict[str, Any]:
         """
@@ -491,7 +498,7 @@ class Phonemizer:
         split_text, cleaned_words = [], set[str]()
         for text in texts:
             cleaned_text = "".join(t for t in text if t.isalnum() or t in punc_set)
-            split = [s for s in re.split(punc_pattern, cleaned_text) if len(s) > 0]
+            split = [s for s in punc_pattern.split(cleaned_text) if len(s) > 0]
             split_text.append(split)
             cleaned_words.update(split)
         return split_text, cleaned_words
@@ -544,8 +551,7 @@ class Phonemizer:
         words_to_split = [w for w in cleaned_words if word_phonemes[w] is None]
 
         word_splits = {
-            key: re.split(
-                r"([-])",
+            key: _HYPHEN_SPLIT_RE.split(
                 self._expand_acronym(word) if self.config.EXPAND_ACRONYMS else word,
             )
             for key, word in zip(words_to_split, words_to_split, strict=False)
@@ -561,6 +567,16 @@ class Phonemizer:
             word for word, phons in word_phonemes.items() if phons is None and len(word_splits.get(word, [])) <= 1
         ]
 
+        if words_to_predict:
+            uncached = []
+            for word in words_to_predict:
+                cached = self._predicted_phonemes.get(word)
+                if cached is None:
+                    uncached.append(word)
+                else:
+                    word_phonemes[word] = cached
+            words_to_predict = uncached
+
         if words_to_predict:
             input_batch = [self.encode(word) for word in words_to_predict]
             input_batch_padded: NDArray[np.int64] = self.pad_sequence_fixed(input_batch, self.config.MODEL_INPUT_LENGTH)
@@ -571,8 +587,12 @@ class Phonemizer:
             ids = self._process_model_output(ort_outs)
 
             # Step 5: Add predictions to the dictionary
+            if len(self._predicted_phonemes) + len(words_to_predict) > self.config.PREDICTION_CACHE_SIZE:
+                self._predicted_phonemes.clear()
             for id, word in zip(ids, words_to_predict, strict=False):
-                word_phonemes[word] = self.decode(id)
+                phons = self.decode(id)
+                word_phonemes[word] = phons
+                self._predicted_phonemes[word] = phons
 
         # Step 6: Get phonemes for each word in the text
         phoneme_lists = []
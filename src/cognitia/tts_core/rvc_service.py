@@ -88,7 +88,7 @@ class RVCServiceClient:
                     available_models = response_data["models"]
                 else:
                     available_models = response_data
-                logger.info(f"RVC service available. Models: {available_models}")
+                logger.info("RVC service available. Models: {}", available_models)
                 
                 # Load model if specified
                 if self.model_name:
@@ -149,7 +149,7 @@ class RVCServiceClient:
                 timeout=5.0
             )
             response.raise_for_status()
-            logger.debug(f"RVC params set: {params}")
+            logger.debug("RVC params set: {}", params)
             return True
         except requests.RequestException as e:
             logger.error(f"Failed to set RVC params: {e}")
@@ -175,16 +175,19 @@ class RVCServiceClient:
                 logger.warning("RVC not initialized, returning original audio")
                 return audio
         
-        start = time.time()
+        start = time.perf_counter()
         
-        # Encode audio to base64 WAV
+        # Encode audio to base64 WAV and frame the JSON body directly as bytes:
+        # base64 output needs no escaping, so this skips the str decode,
+        # json.dumps and re-encode passes over the whole clip.
         audio_bytes = self._audio_to_bytes(audio, sample_rate)
-        audio_b64 = base64.b64encode(audio_bytes).decode('utf-8')
+        body = b"".join((b'{"audio_data": "', base64.b64encode(audio_bytes), b'"}'))
         
         try:
             response = self._session.post(
                 f"{self.service_url}/convert",
-                json={"audio_data": audio_b64},
+                data=body,
+                headers={"Content-Type": "application/json"},
                 timeout=self.timeout
             )
             response.raise_for_status()
@@ -192,8 +195,8 @@ class RVCServiceClient:
             # Decode response audio
             converted_audio = self._bytes_to_audio(response.content, sample_rate)
             
-            elapsed = time.time() - start
-            logger.debug(f"RVC conversion: {elapsed*1000:.1f}ms")
+            elapsed = time.perf_counter() - start
+            logger.debug("RVC conversion: {:.1f}ms", elapsed * 1000)
             
             return converted_audio
             
@@ -231,8 +234,7 @@ class RVCServiceClient:
             audio_int16 = (audio * 32767).astype(np.int16)
             wavfile.write(buffer, sample_rate, audio_int16)
         
-        buffer.seek(0)
-        return buffer.read()
+        return buffer.getvalue()
     
     def _bytes_to_audio(self, data: bytes, target_sr: int) -> NDArray[np.float32]:
         """Convert WAV bytes to numpy audio."""
@@ -243,7 +245,8 @@ class RVCServiceClient:
         else:
             from scipy.io import wavfile  # type: ignore
             sr, audio = wavfile.read(buffer)
-            audio = audio.astype(np.float32) / 32767.0
+            # Scale straight into float32 (one pass, no float64 temporary).
+            audio = np.multiply(audio, np.float32(1.0 / 32767.0), dtype=np.float32)
         
         # Resample if needed
         if sr != target_sr:
@@ -255,7 +258,7 @@ class RVCServiceClient:
                 num_samples = int(len(audio) * target_sr / sr)
                 audio = signal.resample(audio, num_samples)
         
-        return audio.astype(np.float32)
+        return audio.astype(np.float32, copy=False)
     
     def shutdown(self):
         """Shutdown the executor."""
@@ -300,21 +303,23 @@ class RVCServiceSynthesizer:
         Returns:
             Converted audio as float32 numpy array
         """
-        start = time.time()
+        start = time.perf_counter()
         
         # Generate base TTS
         base_audio = self.base_tts.generate_speech_audio(text)
-        tts_time = time.time() - start
+        tts_time = time.perf_counter() - start
         
         if len(base_audio) == 0:
             return base_audio
         
         # Convert through RVC service
-        rvc_start = time.time()
+        rvc_start = time.perf_counter()
         converted_audio = self.rvc_client.convert(base_audio, self.sample_rate)
-        rvc_time = time.time() - rvc_start
+        rvc_time = time.perf_counter() - rvc_start
         
-        total = time.time() - start
-        logger.info(f"TTS+RVC: TTS={tts_time*1000:.0f}ms, RVC={rvc_time*1000:.0f}ms, Total={total*1000:.0f}ms")
+        total = time.perf_counter() - start
+        logger.info(
+            "TTS+RVC: TTS={:.0f}ms, RVC={:.0f}ms, Total={:.0f}ms", tts_time * 1000, rvc_time * 1000, total * 1000
+        )
         
         return converted_audio
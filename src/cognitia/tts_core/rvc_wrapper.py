@@ -82,7 +82,7 @@ class RVCVoiceConverter:
         
         # Initialize RVC
         logger.info(f"Loading RVC model from {self.model_path}")
-        start = time.time()
+        start = time.perf_counter()
         
         if RVCInference is None:
             raise ImportError("RVC not available")
@@ -100,7 +100,7 @@ class RVCVoiceConverter:
             protect=protect,
         )
         
-        logger.success(f"RVC model loaded in {time.time() - start:.2f}s")
+        logger.success(f"RVC model loaded in {time.perf_counter() - start:.2f}s")
     
     def convert(
         self,
@@ -120,7 +120,7 @@ class RVCVoiceConverter:
         import tempfile
         import soundfile as sf
         
-        start = time.time()
+        start = time.perf_counter()
         
         # RVC works with files, so we need to use temp files
         # This adds ~10-20ms overhead but is necessary for the library
@@ -150,7 +150,7 @@ class RVCVoiceConverter:
                     num_samples = int(len(converted_audio) * sample_rate / out_sr)
                     converted_audio = signal.resample(converted_audio, num_samples)
             
-            elapsed = time.time() - start
+            elapsed = time.perf_counter() - start
             logger.debug(f"RVC conversion took {elapsed*1000:.1f}ms")
             
             return converted_audio.astype(np.float32)
@@ -244,21 +244,21 @@ class RVCWrappedSynthesizer:
         Returns:
             Audio as float32 numpy array with the cloned voice
         """
-        start = time.time()
+        start = time.perf_counter()
         
         # Generate base TTS audio
         base_audio = self.base_tts.generate_speech_audio(text)
-        tts_time = time.time() - start
+        tts_time = time.perf_counter() - start
         
         if len(base_audio) == 0:
             return base_audio
         
         # Apply RVC voice conversion
-        rvc_start = time.time()
+        rvc_start = time.perf_counter()
         converted_audio = self.rvc_converter.convert(base_audio, self.sample_rate)
-        rvc_time = time.time() - rvc_start
+        rvc_time = time.perf_counter() - rvc_start
         
-        total_time = time.time() - start
+        total_time = time.perf_counter() - start
         logger.info(f"TTS+RVC: TTS={tts_time*1000:.0f}ms, RVC={rvc_time*1000:.0f}ms, Total={total_time*1000:.0f}ms")
         
         return converted_audio
@@ -202,6 +202,9 @@ class SpeechSynthesizer:
         phoneme_ids_list = [self._phonemes_to_ids(sentence) for sentence in phonemes]
         audio_chunks = [self._synthesize_ids_to_audio(phoneme_ids) for phoneme_ids in phoneme_ids_list]
 
+        if len(audio_chunks) == 1:
+            # Common short-text case: nothing to join, so skip the concatenate copy.
+            return audio_chunks[0].T
         if audio_chunks:
             audio: NDArray[np.float32] = np.concatenate(audio_chunks, axis=1).T
             return audio